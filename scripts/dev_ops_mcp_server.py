@@ -1,29 +1,288 @@
 import sys
 import json
+import re
 import os
+import stat
 import io
 import subprocess
+import sqlite3
+import hashlib
+import threading
+import time
+import functools
+import itertools
+from operator import itemgetter
 from github import Github, Auth
-from github.GithubException import UnknownObjectException, GithubException
+from github.GithubException import UnknownObjectException, GithubException, RateLimitExceededException
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson # Optional C encoder; the stdlib json module is used when it is not installed
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+def _json_bytes(obj) -> bytes:
+    """Serializes compactly to UTF-8 bytes for writing straight to a binary stream."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+def _json_loads(data):
+    """Parses a JSON document from `bytes` or `str`; orjson reads UTF-8 bytes without decoding them first."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# --- Errors ---
+class GithubAPIError(Exception):
+    """A GitHub REST or GraphQL call failed. `status` is the HTTP status, when known."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+class RateLimitError(GithubAPIError):
+    """GitHub rejected the call because a primary or secondary rate limit was exhausted."""
+
+class NotFoundError(GithubAPIError):
+    """GitHub answered 404 for the requested resource."""
+
+class ConnectionNotFoundError(NotFoundError):
+    """A paginated GraphQL connection's parent (e.g. the repository or project) resolved to null."""
+
+def _github_error(status, data, prefix, rate_limited=False):
+    """Builds the typed error for a failed call from its status and REST/GraphQL error body."""
+    data = data if isinstance(data, dict) else {}
+    if data.get('errors'):
+        detail = '; '.join(err.get('message', 'Unknown error') for err in data['errors'])
+    else:
+        detail = data.get('message', 'No message')
+    message = f"{prefix}: {status} - {detail}"
+    if rate_limited or status == 429 or (status == 403 and "rate limit" in detail.lower()):
+        return RateLimitError(message, status)
+    if status == 404:
+        return NotFoundError(message, status)
+    return GithubAPIError(message, status)
+
+def _wrap_github_exception(e, prefix):
+    """Turns a PyGithub GithubException into the matching typed error, message included."""
+    return _github_error(e.status, e.data, prefix, isinstance(e, RateLimitExceededException))
 
 # --- Configuration ---
 # Base path for file system access (for safety)
 # This should be your project root or a specific subdirectory you allow access to.
 BASE_PATH = os.path.abspath(os.environ.get("GEMINI_MCP_BASE_PATH", "."))
+_BASE_REAL = os.path.realpath(BASE_PATH)
+_BASE_PREFIX = _BASE_REAL if _BASE_REAL.endswith(os.sep) else _BASE_REAL + os.sep
+
+# --- Rate Limiting ---
+# Every REST response updates the remaining budget; once it drops below the floor we sleep until the
+# window resets instead of running into 403s. GraphQL has its own points budget read from `rateLimit`.
+# Rate-limited REST responses that do come back are retried by PyGithub's own GithubRetry (Retry-After aware).
+RATE_LIMIT_FLOOR = int(os.environ.get("GEMINI_MCP_RATE_LIMIT_FLOOR", "50"))
+SLEEP_FOR_RATE = os.environ.get("GEMINI_MCP_SLEEP_FOR_RATE", "1") != "0"
+
+_BUDGET = {'remaining': 5000, 'reset': 0}
+_GRAPHQL_BUDGET = {'remaining': 5000, 'reset': 0}
+
+def _wait_for_budget(budget):
+    if not SLEEP_FOR_RATE or budget['remaining'] >= RATE_LIMIT_FLOOR:
+        return
+    delay = budget['reset'] - time.time()
+    if delay > 0:
+        print(f"Rate limit nearly exhausted ({budget['remaining']} left); sleeping {delay:.0f}s until reset.", file=sys.stderr)
+        time.sleep(delay)
+
+def _record_rate_limit_headers(headers):
+    """Updates the matching budget from lower-case x-ratelimit-* response headers and returns it."""
+    budget = _GRAPHQL_BUDGET if headers.get("x-ratelimit-resource") == "graphql" else _BUDGET
+    if "x-ratelimit-remaining" in headers:
+        budget['remaining'] = int(headers["x-ratelimit-remaining"])
+        budget['reset'] = int(headers.get("x-ratelimit-reset", 0))
+    return budget
+
+class _RateLimitedRequester:
+    """Replaces Requester.requestJson: waits out a nearly exhausted budget before each call and tracks x-ratelimit-* headers."""
+
+    def __init__(self, request_json):
+        self._request_json = request_json
+
+    def __call__(self, verb, url, *args, **kwargs):
+        _wait_for_budget(_BUDGET)
+        status, headers, output = self._request_json(verb, url, *args, **kwargs)
+        _record_rate_limit_headers({k.lower(): v for k, v in headers.items()})
+        return status, headers, output
+
+def _track_graphql_rate_limit(rate_limit):
+    if not rate_limit:
+        return
+    _GRAPHQL_BUDGET['remaining'] = rate_limit['remaining']
+    _GRAPHQL_BUDGET['reset'] = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00')).timestamp()
+
+# --- Response Caching ---
+# REST GETs are replayed with If-None-Match/If-Modified-Since; GitHub answers 304 for unchanged
+# resources without charging the primary rate limit. GraphQL has no ETags, so read queries get a short TTL cache,
+# and the serialized results of read-only tools are kept for the same TTL. Any write clears both. Paginated
+# connections bypass the GraphQL cache so a long streamed listing is never held in memory as a whole.
+HTTP_CACHE_PATH = os.path.join(BASE_PATH, ".mcp_cache.db")
+GRAPHQL_CACHE_TTL = 30 # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 128 # per cache
+
+_CACHE_STATS = {"etag_hits": 0, "graphql_hits": 0, "tool_hits": 0}
+_GRAPHQL_CACHE = {}
+_TOOL_RESULT_CACHE = {}
+_cache_lock = threading.Lock()
+
+class _ConditionalRequestCache:
+    """sqlite-backed store of (validators, headers, body) for conditional REST GETs."""
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, body TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        with _cache_lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, headers, body = row
+        return etag, last_modified, json.loads(headers), body
+
+    def put(self, key, etag, last_modified, headers, body):
+        with _cache_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, json.dumps(headers), body)
+            )
+            self._conn.commit()
+
+def _install_conditional_requests(client):
+    """Wraps the client's Requester so GETs are revalidated against the on-disk cache.
+
+    REST writes always clear the in-memory response caches, even when the on-disk cache can't be opened.
+    """
+    requester = getattr(client, "requester", None) or client._Github__requester
+    try:
+        cache = _ConditionalRequestCache(HTTP_CACHE_PATH)
+    except sqlite3.Error as e:
+        # The cache is an optimization; a read-only base or locked file must not disable the GitHub tools.
+        print(f"WARNING: Response cache at {HTTP_CACHE_PATH} is unavailable ({e}); continuing without conditional requests.", file=sys.stderr)
+        cache = None
+    request_json = requester.requestJson
+
+    def conditional_request_json(verb, url, parameters=None, headers=None, input=None, *args, **kwargs):
+        if verb != "GET":
+            if not url.endswith("/graphql"):
+                _clear_response_caches() # REST writes may change what cached GraphQL reads returned
+            return request_json(verb, url, parameters, headers, input, *args, **kwargs)
+        if cache is None:
+            return request_json(verb, url, parameters, headers, input, *args, **kwargs)
+
+        key = json.dumps([url, parameters], sort_keys=True, default=str)
+        cached = cache.get(key)
+        if cached:
+            headers = dict(headers or {})
+            if cached[0]: headers["If-None-Match"] = cached[0]
+            if cached[1]: headers["If-Modified-Since"] = cached[1]
+
+        status, response_headers, output = request_json(verb, url, parameters, headers, input, *args, **kwargs)
+        if status == 304 and cached:
+            with _cache_lock:
+                _CACHE_STATS["etag_hits"] += 1
+            return 200, cached[2], cached[3]
+        if status == 200:
+            lowered = {k.lower(): v for k, v in response_headers.items()}
+            if lowered.get("etag") or lowered.get("last-modified"):
+                cache.put(key, lowered.get("etag"), lowered.get("last-modified"), response_headers, output)
+        return status, response_headers, output
+
+    requester.requestJson = conditional_request_json
+
+def _cache_put(cache, key, value):
+    """Stores `value` stamped with the current time, first dropping expired entries and then the oldest beyond the cap.
+
+    Callers hold `_cache_lock`. Entries are inserted in time order, so the dict's first keys are the oldest.
+    """
+    now = time.monotonic()
+    cache.pop(key, None)
+    for stale_key in [k for k, (stamp, _) in cache.items() if now - stamp >= GRAPHQL_CACHE_TTL]:
+        del cache[stale_key]
+    while len(cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = (now, value)
+
+def _clear_response_caches():
+    with _cache_lock:
+        _GRAPHQL_CACHE.clear()
+        _TOOL_RESULT_CACHE.clear()
+
+def _cache_tool_result(func):
+    """Reuses a read-only tool's result for identical arguments until GRAPHQL_CACHE_TTL passes or a write happens."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, json.dumps([args, kwargs], sort_keys=True, default=str))
+        with _cache_lock:
+            cached = _TOOL_RESULT_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < GRAPHQL_CACHE_TTL:
+                _CACHE_STATS["tool_hits"] += 1
+                return cached[1]
+        result = func(*args, **kwargs)
+        with _cache_lock:
+            _cache_put(_TOOL_RESULT_CACHE, key, result)
+        return result
+    return wrapper
+
+# --- GraphQL Transport ---
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# requests.Session has no default timeout; match PyGithub's so a stalled connection can't block the stdio loop.
+GRAPHQL_TIMEOUT = 15 # seconds
+
+# A string literal (kept verbatim), a punctuator with any whitespace around it, or a whitespace run.
+_GRAPHQL_TOKEN_RE = re.compile(r'("(?:[^"\\]|\\.)*")|\s*(\.\.\.|[{}()\[\]:,!=@|&])\s*|\s+')
+
+@functools.lru_cache(maxsize=256)
+def _minify(query: str) -> str:
+    """Drops the indentation and the whitespace around punctuators that GraphQL ignores, leaving string literals untouched."""
+    return _GRAPHQL_TOKEN_RE.sub(lambda m: m.group(1) or m.group(2) or " ", query).strip()
+
+def _make_graphql_session(token):
+    """One pooled keep-alive session for all GraphQL calls, so TCP/TLS setup is paid once."""
+    session = requests.Session()
+    # POST is outside Retry's default allowed_methods: only failed connections (nothing sent) are retried,
+    # so a mutation is never replayed after a 5xx.
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry))
+    # Every GraphQL call sends the same headers, so they live on the session instead of being rebuilt per request.
+    session.headers.update({"Authorization": f"bearer {token}", "Content-Type": "application/json", "Accept-Encoding": "gzip"})
+    return session
 
 # GitHub Authentication
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+_AUTH_LOGIN = None
+_GRAPHQL_SESSION = None
 if not GITHUB_TOKEN:
     print("WARNING: GITHUB_TOKEN environment variable not set. GitHub tools will not function.", file=sys.stderr)
     github_client = None
 else:
     try:
         auth = Auth.Token(GITHUB_TOKEN)
-        github_client = Github(auth=auth)
+        # GithubRetry (PyGithub's default) is the only retry layer for rate-limited REST calls; fail fast disables it.
+        github_client = Github(auth=auth) if SLEEP_FOR_RATE else Github(auth=auth, retry=None)
+        _requester = getattr(github_client, "requester", None) or github_client._Github__requester
+        _requester.requestJson = _RateLimitedRequester(_requester.requestJson)
+        _install_conditional_requests(github_client)
         # Test authentication by getting the authenticated user
-        github_client.get_user().login # This will raise an exception if token is bad
-        print(f"GitHub client initialized successfully for user: {github_client.get_user().login}", file=sys.stderr)
+        _AUTH_LOGIN = github_client.get_user().login # This will raise an exception if token is bad
+        _GRAPHQL_SESSION = _make_graphql_session(GITHUB_TOKEN)
+        print(f"GitHub client initialized successfully for user: {_AUTH_LOGIN}", file=sys.stderr)
     except Exception as e:
         print(f"ERROR: Failed to initialize GitHub client: {e}. Check GITHUB_TOKEN.", file=sys.stderr)
         github_client = None
@@ -119,6 +378,18 @@ TOOL_DEFINITIONS = [
             "required": ["repo_full_name", "issue_number"]
         }
     },
+    {
+        "name": "github_get_issues",
+        "description": "Retrieves details of several GitHub issues from a specified repository in a single request. Prefer this over repeated github_get_issue calls.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "repo_full_name": {"type": "string", "description": "Full name of the repository (e.g., 'owner/repo-name')."},
+                "issue_numbers": {"type": "array", "items": {"type": "integer"}, "description": "The issue numbers to retrieve."}
+            },
+            "required": ["repo_full_name", "issue_numbers"]
+        }
+    },
     {
         "name": "github_update_issue",
         "description": "Updates an existing GitHub issue. Provide the full repository name and issue number. You can update title, body, state ('open' or 'closed'), labels (replaces all), assignees (replaces all), or milestone.",
@@ -139,13 +410,13 @@ TOOL_DEFINITIONS = [
     },
     {
         "name": "github_list_issues",
-        "description": "Lists GitHub issues in a specified repository, with optional filters (state, labels, assignee, milestone, sort, direction, since).",
+        "description": "Lists GitHub issues in a specified repository, with optional filters (state, labels, assignee, milestone, sort, direction, since). Pull requests are not included.",
         "parameters": {
             "type": "object",
             "properties": {
                 "repo_full_name": {"type": "string", "description": "Full name of the repository (e.g., 'owner/repo-name')."},
                 "state": {"type": "string", "enum": ["open", "closed", "all"], "description": "Filter by issue state.", "default": "open"},
-                "labels": {"type": "array", "items": {"type": "string"}, "description": "Filter by labels (e.g., ['bug', 'feature']).", "default": []},
+                "labels": {"type": "array", "items": {"type": "string"}, "description": "Only issues that have all of these labels (e.g., ['bug', 'feature']).", "default": []},
                 "assignee": {"type": "string", "description": "Filter by assignee username. Use 'none' for unassigned issues.", "default": None},
                 "milestone_number": {"type": "integer", "description": "Filter by milestone number.", "default": None},
                 "sort": {"type": "string", "enum": ["created", "updated", "comments"], "description": "Sort order.", "default": "created"},
@@ -177,7 +448,8 @@ TOOL_DEFINITIONS = [
             "type": "object",
             "properties": {
                 "project_url": {"type": "string", "description": "The URL of the Project (V2)."},
-                "state": {"type": "string", "enum": ["OPEN", "CLOSED"], "description": "Filter by item state (OPEN or CLOSED).", "default": "OPEN"}
+                "state": {"type": "string", "enum": ["OPEN", "CLOSED"], "description": "Filter by item state (OPEN or CLOSED).", "default": "OPEN"},
+                "include_content": {"type": "boolean", "description": "Include issue/PR body, labels, assignees, milestone and timestamps. Set to false for a lean listing of number, title, state and URL.", "default": True}
             },
             "required": ["project_url"]
         }
@@ -209,6 +481,11 @@ TOOL_DEFINITIONS = [
             "required": ["project_url", "item_id"]
         }
     },
+    {
+        "name": "github_refresh_project_cache",
+        "description": "Clears the cached Project (V2) node IDs, fields, and single-select options. Use this after renaming fields or adding options on a project board.",
+        "parameters": {"type": "object", "properties": {}} # No parameters
+    },
     # New uv and ruff Tools
     {
         "name": "uv_sync",
@@ -226,6 +503,17 @@ TOOL_DEFINITIONS = [
             "required": ["package_name"]
         }
     },
+    {
+        "name": "uv_add_many",
+        "description": "Adds several Python packages in one resolve. Runs 'uv add <package_1> <package_2> ...'.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "package_names": {"type": "array", "items": {"type": "string"}, "description": "The packages to add (e.g., ['requests', 'numpy==1.23.0'])."}
+            },
+            "required": ["package_names"]
+        }
+    },
     {
         "name": "uv_remove",
         "description": "Removes a Python package from pyproject.toml and uninstalls it. Runs 'uv remove <package_name>'.",
@@ -249,6 +537,18 @@ TOOL_DEFINITIONS = [
             "required": []
         }
     },
+    {
+        "name": "ruff_check_many",
+        "description": "Runs Ruff linting checks on several paths in one invocation. Runs 'ruff check <path_1> <path_2> ...'.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "paths": {"type": "array", "items": {"type": "string"}, "description": "The paths to check (e.g., ['src/', 'scripts/main.py'])."},
+                "fix": {"type": "boolean", "description": "Attempt to automatically fix linting issues (runs 'ruff check --fix').", "default": False}
+            },
+            "required": ["paths"]
+        }
+    },
     {
         "name": "ruff_format",
         "description": "Formats Python code using Ruff. Runs 'ruff format <path>'.",
@@ -259,58 +559,138 @@ TOOL_DEFINITIONS = [
             },
             "required": []
         }
+    },
+    {
+        "name": "ruff_format_many",
+        "description": "Formats several paths with Ruff in one invocation. Runs 'ruff format <path_1> <path_2> ...'.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "paths": {"type": "array", "items": {"type": "string"}, "description": "The paths to format (e.g., ['src/', 'scripts/main.py'])."}
+            },
+            "required": ["paths"]
+        }
     }
 ]
 
+# The tool list never changes at runtime, so it is serialized once and replayed for every mcp_queryTools.
+_TOOL_DEFINITIONS_JSON = _json_dumps(TOOL_DEFINITIONS).encode()
+
+def get_tool_definitions_bytes() -> bytes:
+    return _TOOL_DEFINITIONS_JSON
+
 # --- File System Operations (Implementations) ---
+def _is_within_base(path):
+    return path == _BASE_REAL or path.startswith(_BASE_PREFIX)
+
 def get_safe_path(requested_path):
-    absolute_path = os.path.abspath(os.path.join(BASE_PATH, requested_path))
-    if not absolute_path.startswith(BASE_PATH):
+    # normpath on an already-absolute join avoids abspath's getcwd() call.
+    absolute_path = os.path.normpath(os.path.join(_BASE_REAL, requested_path))
+    # realpath also runs for paths that don't exist yet: it resolves every existing component (and dangling links),
+    # so a new file under a symlinked directory is checked against where it would really be written.
+    if not _is_within_base(absolute_path) or not _is_within_base(os.path.realpath(absolute_path)):
         raise ValueError(f"Access denied: Path '{requested_path}' is outside the allowed base directory.")
     return absolute_path
 
+IO_BUFFER_SIZE = 1 << 16
+READ_CHUNK_SIZE = 1 << 20
+SMALL_FILE_SIZE = 4 << 10
+LARGE_FILE_SIZE = 4 << 20
+
+def _read_raw(safe_path: str) -> str:
+    fd = os.open(safe_path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode('utf-8')
+    if "\r" in text: # Match text-mode universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 def _read_file(path: str) -> str:
     safe_path = get_safe_path(path)
-    if not os.path.isfile(safe_path):
+    try:
+        st = os.stat(safe_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"File not found: {path}")
-    with open(safe_path, 'r', encoding='utf-8') as f:
+    # Tiny and very large files skip TextIOWrapper and are decoded once. Pseudo-files report
+    # st_size 0, so they always take the buffered path with an explicit buffer size.
+    if 0 < st.st_size < SMALL_FILE_SIZE or st.st_size > LARGE_FILE_SIZE:
+        return _read_raw(safe_path)
+    with io.open(safe_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
         return f.read()
 
+RAW_WRITE_THRESHOLD = 1 << 20
+
+def _write_raw(safe_path: str, content: str, flags: int):
+    # Large payloads are encoded once and written straight to the fd, skipping TextIOWrapper/BufferedWriter copies.
+    view = memoryview(content.encode('utf-8'))
+    fd = os.open(safe_path, os.O_WRONLY | os.O_CREAT | flags, 0o644)
+    try:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
 def _write_file(path: str, content: str) -> str:
     safe_path = get_safe_path(path)
     os.makedirs(os.path.dirname(safe_path), exist_ok=True)
-    with open(safe_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    if len(content) > RAW_WRITE_THRESHOLD:
+        _write_raw(safe_path, content, os.O_TRUNC)
+    else:
+        with open(safe_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            f.write(content)
     return f"File '{path}' written successfully."
 
 def _append_to_file(path: str, content: str) -> str:
     safe_path = get_safe_path(path)
     os.makedirs(os.path.dirname(safe_path), exist_ok=True)
-    with open(safe_path, 'a', encoding='utf-8') as f:
-        f.write(content)
+    if len(content) > RAW_WRITE_THRESHOLD:
+        _write_raw(safe_path, content, os.O_APPEND)
+    else:
+        with open(safe_path, 'a', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            f.write(content)
     return f"Content appended to file '{path}' successfully."
 
-def _list_directory(path: str, recursive: bool = False) -> str:
+def _iter_directory(path: str, recursive: bool = False):
+    """Yields listing lines one at a time; see `_list_directory` for the format."""
     safe_path = get_safe_path(path)
     if not os.path.isdir(safe_path):
         raise NotADirectoryError(f"Directory not found: {path}")
-    output = io.StringIO()
     if recursive:
-        for root, dirs, files in os.walk(safe_path):
-            level = root.replace(safe_path, '').count(os.sep)
-            indent = ' ' * 4 * (level)
-            output.write(f"{indent}{os.path.basename(root)}/\n")
+        # Depth-first walk straight off os.scandir, matching os.walk: DirEntry.is_dir() answers from the
+        # readdir record, symlinked directories are neither listed nor followed, unreadable ones are omitted.
+        stack = [(safe_path, 0)]
+        while stack:
+            root, level = stack.pop()
+            subdirs, files = [], []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            files.append(entry.name)
+                        elif not entry.is_symlink():
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+            yield f"{' ' * 4 * level}{os.path.basename(root)}/"
             sub_indent = ' ' * 4 * (level + 1)
-            for f in files:
-                output.write(f"{sub_indent}{f}\n")
+            for name in files:
+                yield sub_indent + name
+            stack.extend((d, level + 1) for d in reversed(subdirs))
     else:
-        for entry in os.listdir(safe_path):
-            full_path = os.path.join(safe_path, entry)
-            if os.path.isdir(full_path):
-                output.write(f"{entry}/\n")
-            else:
-                output.write(f"{entry}\n")
-    return output.getvalue().strip()
+        with os.scandir(safe_path) as it:
+            for entry in it:
+                yield entry.name + "/" if entry.is_dir() else entry.name
+
+def _list_directory(path: str, recursive: bool = False) -> str:
+    return "\n".join(_iter_directory(path, recursive))
 
 def _create_directory(path: str) -> str:
     safe_path = get_safe_path(path)
@@ -318,17 +698,37 @@ def _create_directory(path: str) -> str:
     return f"Directory '{path}' created successfully."
 
 # --- GitHub Tool Implementations ---
+# Independent GitHub requests are overlapped on this pool; kept small so bursts stay under the rate limiter.
+_GITHUB_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_REPO_NODE_ID_CACHE: dict[str, str] = {}
+
+def _invalidate_repo_caches(repo_full_name, e):
+    """Forgets cached handles for a repository when GitHub reports it unauthorized or gone."""
+    if e.status in (401, 403, 404):
+        _get_repo.cache_clear()
+        _REPO_NODE_ID_CACHE.pop(repo_full_name, None)
+
+@functools.lru_cache(maxsize=64)
 def _get_repo(repo_full_name):
     if not github_client:
-        raise Exception("GitHub client not initialized. GITHUB_TOKEN is missing or invalid.")
+        raise GithubAPIError("GitHub client not initialized. GITHUB_TOKEN is missing or invalid.")
     try:
         return github_client.get_repo(repo_full_name)
     except UnknownObjectException:
         raise ValueError(f"Repository '{repo_full_name}' not found or access denied. Check repo name and token permissions.")
     except GithubException as e:
-        raise Exception(f"GitHub API error getting repo: {e.status} - {e.data.get('message', 'No message')}")
+        raise _wrap_github_exception(e, "GitHub API error getting repo")
+
+def _split_repo_full_name(repo_full_name: str):
+    owner, _, name = repo_full_name.partition('/')
+    if not owner or not name:
+        raise ValueError(f"Invalid repository name '{repo_full_name}'. Use the full name (e.g., 'owner/repo-name').")
+    return owner, name
 
-def _github_create_issue(repo_full_name: str, title: str, body: str = "", labels: list = [], assignees: list = [], milestone_number: int = None) -> str:
+def _github_create_issue(repo_full_name: str, title: str, body: str = "", labels: list | None = None, assignees: list | None = None, milestone_number: int = None) -> str:
+    # PyGithub validates these with is_optional_list, which accepts only a list (not a tuple).
+    labels = list(labels) if labels else []
+    assignees = list(assignees) if assignees else []
     repo = _get_repo(repo_full_name)
     milestone = None
     if milestone_number:
@@ -342,44 +742,183 @@ def _github_create_issue(repo_full_name: str, title: str, body: str = "", labels
             title=title,
             body=body,
             labels=labels,
-            assignees=assignees if assignees else Github.NO_ASSIGNEES,
+            assignees=assignees,
             milestone=milestone
         )
-        return json.dumps({
+        return _json_dumps({
             "success": True,
             "message": f"Issue '{issue.title}' created successfully.",
             "issue_number": issue.number,
             "issue_url": issue.html_url
         })
     except GithubException as e:
-        raise Exception(f"GitHub API error creating issue: {e.status} - {e.data.get('message', 'No message')}")
+        _invalidate_repo_caches(repo_full_name, e)
+        raise _wrap_github_exception(e, "GitHub API error creating issue")
 
+def _serialize_issue(rd: dict, include_body: bool = True) -> dict:
+    """Builds the tool-facing issue dict from a REST `raw_data`-shaped dict (see `_issue_node_to_raw`)."""
+    issue = {
+        "number": rd['number'],
+        "title": rd['title'],
+        "state": rd['state'],
+        "url": rd['html_url'],
+        "labels": [l['name'] for l in rd['labels']],
+        "assignees": [a['login'] for a in rd['assignees']],
+        "milestone": rd['milestone']['title'] if rd.get('milestone') else None,
+        "created_at": rd['created_at'],
+        "updated_at": rd['updated_at'],
+        "closed_at": rd.get('closed_at')
+    }
+    if include_body:
+        issue['body'] = rd.get('body')
+    return issue
+
+def _issue_node_to_raw(node: dict) -> dict:
+    """Renames GraphQL Issue/PullRequest fields to their REST `raw_data` keys."""
+    return {
+        "number": node.get('number'),
+        "title": node.get('title'),
+        "body": node.get('body'),
+        "state": node['state'].lower() if node.get('state') else None,
+        "html_url": node.get('url'),
+        "labels": (node.get('labels') or {}).get('nodes', []),
+        "assignees": (node.get('assignees') or {}).get('nodes', []),
+        "milestone": node.get('milestone'),
+        "created_at": node.get('createdAt'),
+        "updated_at": node.get('updatedAt'),
+        "closed_at": node.get('closedAt')
+    }
+
+_ISSUE_FIELDS = "number title body state url labels(first: 100) { nodes { name } } assignees(first: 100) { nodes { login } } milestone { title } createdAt updatedAt closedAt"
+
+def _github_get_issues_bulk(repo_full_name: str, issue_numbers: list) -> dict:
+    """Fetches many issues with one aliased GraphQL query per 100 numbers. Missing issues map to None."""
+    owner, name = _split_repo_full_name(repo_full_name)
+    numbers = list(dict.fromkeys(int(n) for n in issue_numbers))
+    issues = {}
+    for start in range(0, len(numbers), 100):
+        chunk = numbers[start:start + 100]
+        aliases = "\n".join(f"i{n}: issue(number: {n}) {{ {_ISSUE_FIELDS} }}" for n in chunk)
+        query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+        data = _graphql_query(query, {"owner": owner, "name": name})
+        repository = data.get('repository')
+        if repository is None:
+            raise ValueError(f"Repository '{repo_full_name}' not found or access denied.")
+        for n in chunk:
+            node = repository.get(f"i{n}")
+            issues[n] = _serialize_issue(_issue_node_to_raw(node)) if node else None
+    return issues
+
+@_cache_tool_result
 def _github_get_issue(repo_full_name: str, issue_number: int) -> str:
-    repo = _get_repo(repo_full_name)
-    try:
-        issue = repo.get_issue(issue_number)
-        return json.dumps({
-            "number": issue.number,
-            "title": issue.title,
-            "body": issue.body,
-            "state": issue.state,
-            "url": issue.html_url,
-            "labels": [label.name for label in issue.labels],
-            "assignees": [assignee.login for assignee in issue.assignees],
-            "milestone": issue.milestone.title if issue.milestone else None,
-            "created_at": issue.created_at.isoformat(),
-            "updated_at": issue.updated_at.isoformat(),
-            "closed_at": issue.closed_at.isoformat() if issue.closed_at else None
-        })
-    except UnknownObjectException:
+    issue = _github_get_issues_bulk(repo_full_name, [issue_number])[int(issue_number)]
+    if issue is None:
         raise ValueError(f"Issue #{issue_number} not found in repository '{repo_full_name}'.")
-    except GithubException as e:
-        raise Exception(f"GitHub API error getting issue: {e.status} - {e.data.get('message', 'No message')}")
+    return _json_dumps(issue)
+
+@_cache_tool_result
+def _github_get_issues(repo_full_name: str, issue_numbers: list) -> str:
+    issues = _github_get_issues_bulk(repo_full_name, issue_numbers)
+    missing = [n for n, issue in issues.items() if issue is None]
+    return _json_dumps({
+        "issues": [issue for issue in issues.values() if issue is not None],
+        "not_found": missing
+    })
+
+def _resolve_repo_node_id(repo_full_name: str) -> str:
+    if repo_full_name in _REPO_NODE_ID_CACHE:
+        return _REPO_NODE_ID_CACHE[repo_full_name]
+    owner, name = _split_repo_full_name(repo_full_name)
+    data = _graphql_query("query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { id } }", {"owner": owner, "name": name})
+    if not data.get('repository'):
+        raise ValueError(f"Repository '{repo_full_name}' not found or access denied.")
+    _REPO_NODE_ID_CACHE[repo_full_name] = data['repository']['id']
+    return _REPO_NODE_ID_CACHE[repo_full_name]
+
+@functools.lru_cache(maxsize=256)
+def _resolve_issue_node_id(repo_full_name: str, issue_number: int) -> str:
+    owner, name = _split_repo_full_name(repo_full_name)
+    query = "query($owner: String!, $name: String!, $number: Int!) { repository(owner: $owner, name: $name) { issue(number: $number) { id } } }"
+    data = _graphql_query(query, {"owner": owner, "name": name, "number": issue_number})
+    issue = (data.get('repository') or {}).get('issue')
+    if not issue:
+        raise ValueError(f"Issue #{issue_number} not found in repository '{repo_full_name}'.")
+    return issue['id']
+
+@functools.lru_cache(maxsize=256)
+def _resolve_label_ids(repo_id: str, names: tuple) -> tuple:
+    if not names:
+        return ()
+    aliases = " ".join(f"l{i}: label(name: {json.dumps(n)}) {{ id }}" for i, n in enumerate(names))
+    data = _graphql_query(f"query($id: ID!) {{ node(id: $id) {{ ... on Repository {{ {aliases} }} }} }}", {"id": repo_id})
+    repository = data.get('node') or {}
+    missing = [n for i, n in enumerate(names) if not repository.get(f"l{i}")]
+    if missing:
+        raise ValueError(f"Labels not found in repository: {missing}")
+    return tuple(repository[f"l{i}"]['id'] for i in range(len(names)))
+
+@functools.lru_cache(maxsize=256)
+def _resolve_user_ids(logins: tuple) -> tuple:
+    if not logins:
+        return ()
+    aliases = " ".join(f"u{i}: user(login: {json.dumps(l)}) {{ id }}" for i, l in enumerate(logins))
+    data = _graphql_query(f"query {{ {aliases} }}")
+    missing = [l for i, l in enumerate(logins) if not data.get(f"u{i}")]
+    if missing:
+        raise ValueError(f"Users not found: {missing}")
+    return tuple(data[f"u{i}"]['id'] for i in range(len(logins)))
+
+@functools.lru_cache(maxsize=128)
+def _resolve_milestone_id(repo_id: str, milestone_number: int) -> str:
+    query = "query($id: ID!, $number: Int!) { node(id: $id) { ... on Repository { milestone(number: $number) { id } } } }"
+    data = _graphql_query(query, {"id": repo_id, "number": milestone_number})
+    milestone = (data.get('node') or {}).get('milestone')
+    if not milestone:
+        raise ValueError(f"Milestone number {milestone_number} not found in repository.")
+    return milestone['id']
+
+_UPDATE_ISSUE_MUTATION = _minify("""
+    mutation($input: UpdateIssueInput!) {
+        updateIssue(input: $input) {
+            issue {
+                url
+            }
+        }
+    }
+""")
 
 def _github_update_issue(repo_full_name: str, issue_number: int, title: str = None, body: str = None, state: str = None, labels: list = None, assignees: list = None, milestone_number: int = None) -> str:
+    try:
+        mutation_input = {"id": _resolve_issue_node_id(repo_full_name, issue_number)}
+        if title is not None: mutation_input['title'] = title
+        if body is not None: mutation_input['body'] = body
+        if state is not None: mutation_input['state'] = state.upper()
+        if labels is not None:
+            mutation_input['labelIds'] = list(_resolve_label_ids(_resolve_repo_node_id(repo_full_name), tuple(labels)))
+        if assignees is not None:
+            mutation_input['assigneeIds'] = list(_resolve_user_ids(tuple(assignees)))
+        if milestone_number is not None:
+            mutation_input['milestoneId'] = None if milestone_number == -1 else _resolve_milestone_id(_resolve_repo_node_id(repo_full_name), milestone_number)
+
+        data = _graphql_query(_UPDATE_ISSUE_MUTATION, {"input": mutation_input})
+        issue_url = data['updateIssue']['issue']['url']
+    except (ValueError, RateLimitError):
+        raise
+    except Exception as e:
+        print(f"GraphQL updateIssue failed ({e}); falling back to REST.", file=sys.stderr)
+        return _github_update_issue_rest(repo_full_name, issue_number, title, body, state, labels, assignees, milestone_number)
+
+    return _json_dumps({
+        "success": True,
+        "message": f"Issue #{issue_number} updated successfully.",
+        "issue_url": issue_url
+    })
+
+def _github_update_issue_rest(repo_full_name: str, issue_number: int, title: str = None, body: str = None, state: str = None, labels: list = None, assignees: list = None, milestone_number: int = None) -> str:
     repo = _get_repo(repo_full_name)
     try:
         issue = repo.get_issue(issue_number)
+        rd = issue.raw_data # Fetched once by get_issue; attribute access on nested objects may lazily re-fetch
         
         update_params = {}
         if title is not None: update_params['title'] = title
@@ -390,15 +929,12 @@ def _github_update_issue(repo_full_name: str, issue_number: int, title: str = No
             issue.set_labels(*labels) 
         
         if assignees is not None:
-            current_assignees = [a.login for a in issue.assignees]
+            current_assignees = [a['login'] for a in rd['assignees']]
             to_add = [a for a in assignees if a not in current_assignees]
             to_remove = [a for a in current_assignees if a not in assignees]
             
             if to_add: issue.add_to_assignees(*to_add)
             if to_remove: issue.remove_from_assignees(*to_remove)
-            
-            if not assignees and current_assignees:
-                issue.remove_from_assignees(*current_assignees)
 
         if milestone_number is not None:
             milestone = None
@@ -412,81 +948,175 @@ def _github_update_issue(repo_full_name: str, issue_number: int, title: str = No
         if update_params:
             issue.edit(**update_params)
         
-        return json.dumps({
+        return _json_dumps({
             "success": True,
             "message": f"Issue #{issue_number} updated successfully.",
-            "issue_url": issue.html_url
+            "issue_url": rd['html_url']
         })
     except UnknownObjectException:
         raise ValueError(f"Issue #{issue_number} not found in repository '{repo_full_name}'.")
     except GithubException as e:
-        raise Exception(f"GitHub API error updating issue: {e.status} - {e.data.get('message', 'No message')}")
+        _invalidate_repo_caches(repo_full_name, e)
+        raise _wrap_github_exception(e, "GitHub API error updating issue")
 
-def _github_list_issues(repo_full_name: str, state: str = "open", labels: list = [], assignee: str = None, milestone_number: int = None, sort: str = "created", direction: str = "desc", since: str = None) -> str:
-    repo = _get_repo(repo_full_name)
-    issues_list = []
-    
-    params = {
-        "state": state,
-        "labels": labels,
-        "assignee": assignee if assignee != "none" else Github.NO_ASSIGNEES,
-        "sort": sort,
-        "direction": direction
+_LIST_ISSUES_QUERY = _minify("""
+    query($owner: String!, $name: String!, $first: Int!, $after: String, $states: [IssueState!], $labels: [String!], $orderBy: IssueOrder, $filterBy: IssueFilters) {
+        repository(owner: $owner, name: $name) {
+            issues(first: $first, after: $after, states: $states, labels: $labels, orderBy: $orderBy, filterBy: $filterBy) {
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {
+                    number title state url labels(first: 100) { nodes { name } } assignees(first: 100) { nodes { login } } milestone { title } createdAt updatedAt closedAt
+                }
+            }
+        }
     }
+""")
+
+_ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}
+_ISSUE_ORDER_FIELDS = {"created": "CREATED_AT", "updated": "UPDATED_AT", "comments": "COMMENTS"}
+
+def _check_milestone(repo_full_name: str, milestone_number: int):
+    try:
+        _get_repo(repo_full_name).get_milestone(milestone_number)
+    except UnknownObjectException:
+        raise ValueError(f"Milestone number {milestone_number} not found in repository '{repo_full_name}'.")
+
+@functools.lru_cache(maxsize=256)
+def _parse_since(since: str) -> str:
+    try:
+        return datetime.fromisoformat(since.replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        raise ValueError("Invalid 'since' date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SSZ).")
+
+def _iter_issues(repo_full_name: str, state: str = "open", labels: list | None = None, assignee: str = None, milestone_number: int = None, sort: str = "created", direction: str = "desc", since: str = None):
+    """Yields serialized issues page by page; see `_github_list_issues` for the filters."""
+    owner, name = _split_repo_full_name(repo_full_name)
+    states = _ISSUE_STATES.get(state)
+    if states is None:
+        raise ValueError(f"Invalid state '{state}'. Use 'open', 'closed' or 'all'.")
+
+    filter_by = {}
+    milestone_check = None
+    if assignee and assignee != "none":
+        filter_by["assignee"] = assignee
     if milestone_number is not None:
-        try:
-            params["milestone"] = repo.get_milestone(milestone_number)
-        except UnknownObjectException:
-            raise ValueError(f"Milestone number {milestone_number} not found in repository '{repo_full_name}'.")
+        # Validate the milestone over REST while the first issues page is fetched.
+        milestone_check = _GITHUB_EXECUTOR.submit(_check_milestone, repo_full_name, milestone_number)
+        filter_by["milestoneNumber"] = str(milestone_number)
     if since:
-        try:
-            params["since"] = datetime.fromisoformat(since.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError("Invalid 'since' date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SSZ).")
+        filter_by["since"] = _parse_since(since)
 
+    variables = {
+        "owner": owner,
+        "name": name,
+        "first": 100,
+        "states": states,
+        "labels": labels or None,
+        "orderBy": {"field": _ISSUE_ORDER_FIELDS.get(sort, "CREATED_AT"), "direction": direction.upper()},
+        "filterBy": filter_by or None
+    }
+    nodes = _graphql_iter_nodes(_LIST_ISSUES_QUERY, variables, ("repository", "issues"))
     try:
-        for issue in repo.get_issues(**params):
-            issues_list.append({
-                "number": issue.number,
-                "title": issue.title,
-                "state": issue.state,
-                "url": issue.html_url,
-                "labels": [label.name for label in issue.labels],
-                "assignees": [assignee.login for assignee in issue.assignees],
-                "milestone": issue.milestone.title if issue.milestone else None,
-                "created_at": issue.created_at.isoformat(),
-                "updated_at": issue.updated_at.isoformat()
-            })
-        return json.dumps(issues_list, indent=2)
-    except UnknownObjectException:
+        first = next(nodes, None)
+    except ConnectionNotFoundError:
         raise ValueError(f"Repository '{repo_full_name}' not found or access denied.")
-    except GithubException as e:
-        raise Exception(f"GitHub API error listing issues: {e.status} - {e.data.get('message', 'No message')}")
+    if milestone_check:
+        milestone_check.result()
+    if first is None:
+        return
+
+    # GraphQL's `labels` filter matches issues with any of the labels; the tool keeps REST's all-of semantics.
+    required_labels = {l.casefold() for l in labels} if labels else None
+    for node in itertools.chain([first], nodes):
+        issue = _serialize_issue(_issue_node_to_raw(node), include_body=False)
+        if assignee == "none" and issue['assignees']:
+            continue
+        if required_labels and not required_labels <= {l.casefold() for l in issue['labels']}:
+            continue
+        yield issue
+
+def _github_list_issues(repo_full_name: str, state: str = "open", labels: list | None = None, assignee: str = None, milestone_number: int = None, sort: str = "created", direction: str = "desc", since: str = None) -> str:
+    return "".join(_iter_json_array(_iter_issues(repo_full_name, state, labels, assignee, milestone_number, sort, direction, since)))
+
+_URL_PATH_RE = re.compile(r'/(users|orgs)/([^/]+)/projects/(\d+)')
 
 def _get_project_id_from_url(project_url: str):
-    parts = project_url.strip('/').split('/')
-    if "users" in parts:
-        user_or_org_type = "user"
-        owner_login = parts[parts.index("users") + 1]
-        project_number = int(parts[parts.index("projects") + 1])
-    elif "orgs" in parts:
-        user_or_org_type = "organization"
-        owner_login = parts[parts.index("orgs") + 1]
-        project_number = int(parts[parts.index("projects") + 1])
-    else:
+    match = _URL_PATH_RE.search(project_url)
+    if not match:
         raise ValueError(f"Invalid GitHub Project URL format: {project_url}. Must be for a user or organization project (e.g., 'https://github.com/orgs/my-org/projects/1').")
-    return user_or_org_type, owner_login, project_number
+    owner_kind, owner_login, project_number = match.groups()
+    user_or_org_type = "user" if owner_kind == "users" else "organization"
+    return user_or_org_type, owner_login, int(project_number)
 
-def _graphql_query(query, variables=None):
+def _graphql_query(query, variables=None, cache=True):
     if not github_client:
-        raise Exception("GitHub client not initialized. GITHUB_TOKEN is missing or invalid.")
+        raise GithubAPIError("GitHub client not initialized. GITHUB_TOKEN is missing or invalid.")
+    # Module-level queries are minified at import; this also covers the ones built inside functions.
+    query = _minify(query)
+    is_mutation = query.startswith("mutation")
+    if is_mutation:
+        _clear_response_caches()
+        cache_key = None
+    else:
+        cache_key = hashlib.sha256(json.dumps([query, variables], sort_keys=True).encode()).hexdigest() if cache else None
+        if cache_key:
+            with _cache_lock:
+                cached = _GRAPHQL_CACHE.get(cache_key)
+                if cached and time.monotonic() - cached[0] < GRAPHQL_CACHE_TTL:
+                    _CACHE_STATS["graphql_hits"] += 1
+                    return cached[1]
+        # Ask for the query's cost alongside the data so the points budget can be throttled.
+        query = query.rstrip()[:-1] + " rateLimit { remaining resetAt cost } }"
+    _wait_for_budget(_GRAPHQL_BUDGET)
+    # Pre-encoded body: requests' json= would re-serialize with the stdlib encoder and set Content-Type on each call.
+    response = _GRAPHQL_SESSION.post(GITHUB_GRAPHQL_URL, data=_json_bytes({"query": query, "variables": variables or {}}), timeout=GRAPHQL_TIMEOUT)
+    _record_rate_limit_headers(response.headers)
     try:
-        return github_client.post_graphql(query, variables)
-    except GithubException as e:
-        errors = e.data.get('errors', [])
-        error_messages = [err.get('message', 'Unknown error') for err in errors]
-        raise Exception(f"GitHub GraphQL API error: {e.status} - {'; '.join(error_messages)}")
+        # Parse the raw body directly; GraphQL responses are always UTF-8, so the text decode is skipped.
+        payload = _json_loads(response.content)
+    except ValueError:
+        payload = {}
+    # GraphQL reports most failures as HTTP 200 with an `errors` list next to (partial) data. Reads whose only
+    # errors are NOT_FOUND come back for the caller to inspect (each missing field is null); anything else raises.
+    errors = payload.get('errors') or []
+    if (response.status_code != 200 or payload.get('data') is None or (errors and is_mutation)
+            or any(err.get('type') != 'NOT_FOUND' for err in errors)):
+        rate_limited = any(err.get('type') == 'RATE_LIMITED' for err in errors)
+        raise _github_error(response.status_code, payload, "GitHub GraphQL API error", rate_limited)
+    data = payload['data']
+    _track_graphql_rate_limit(data.pop('rateLimit', None))
+    if cache_key:
+        with _cache_lock:
+            _cache_put(_GRAPHQL_CACHE, cache_key, data)
+    return data
 
+def _graphql_iter_nodes(query, variables, path):
+    """Follows `pageInfo` cursors for the connection at `path`, yielding its nodes as each page arrives.
+
+    Cursors are opaque, so pages can't be requested out of order; instead the next page is fetched on
+    the worker pool while the caller is still consuming the current one.
+    """
+    def fetch(after):
+        connection = _graphql_query(query, dict(variables, after=after), cache=False)
+        for key in path:
+            connection = connection.get(key) if connection else None
+        if connection is None:
+            raise ConnectionNotFoundError(f"No '{'.'.join(path)}' connection in GraphQL response.")
+        return connection
+
+    connection = fetch(None)
+    while True:
+        page_info = connection['pageInfo']
+        next_page = _GITHUB_EXECUTOR.submit(fetch, page_info['endCursor']) if page_info['hasNextPage'] else None
+        yield from connection['nodes']
+        if next_page is None:
+            return
+        connection = next_page.result()
+
+@functools.lru_cache(maxsize=128)
 def _get_project_node_id(project_url: str):
     owner_type, owner_login, project_number = _get_project_id_from_url(project_url)
     
@@ -503,17 +1133,20 @@ def _get_project_node_id(project_url: str):
     variables = {"login": owner_login, "number": project_number}
     data = _graphql_query(query, variables)
     
-    project_id = data.get(owner_type, {}).get('projectV2', {}).get('id')
+    project_id = ((data.get(owner_type) or {}).get('projectV2') or {}).get('id')
     
     if not project_id:
         raise ValueError(f"Could not find project Node ID for {project_url}. Check URL, project number, and token permissions (requires 'project' scope).")
     return project_id
 
-def _get_project_field_id_and_options(project_node_id: str, field_name: str):
-    query = """
-        query($project_id: ID!) {
-            node(id: $project_id) {
-                ... on ProjectV2 {
+def _get_project_field_id_and_options(project_url: str, field_name: str):
+    # Looked up by owner/number rather than node ID so it can run alongside _get_project_node_id.
+    owner_type, owner_login, project_number = _get_project_id_from_url(project_url)
+
+    query_template = """
+        query($login: String!, $number: Int!) {
+            %s(login: $login) {
+                projectV2(number: $number) {
                     fields(first: 100) {
                         nodes {
                             ... on ProjectV2Field {
@@ -534,25 +1167,47 @@ def _get_project_field_id_and_options(project_node_id: str, field_name: str):
             }
         }
     """
-    variables = {"project_id": project_node_id}
+    query = query_template % owner_type
+    variables = {"login": owner_login, "number": project_number}
     data = _graphql_query(query, variables)
     
-    fields = data['node']['fields']['nodes']
+    project = (data.get(owner_type) or {}).get('projectV2')
+    if not project:
+        raise ValueError(f"Could not find project {project_url}. Check URL, project number, and token permissions (requires 'project' scope).")
+    fields = project['fields']['nodes']
     
     target_field = None
     for field in fields:
-        if field['name'].lower() == field_name.lower():
+        if field.get('name', '').lower() == field_name.lower():
             target_field = field
             break
     
     if not target_field:
-        raise ValueError(f"Field '{field_name}' not found in project '{project_node_id}'.")
+        raise ValueError(f"Field '{field_name}' not found in project '{project_url}'.")
     
     field_id = target_field['id']
     options = {option['name'].lower(): option['id'] for option in target_field.get('options', [])}
     
     return field_id, options
 
+# Field and single-select option sets rarely change, but options can be added on the board mid-session.
+PROJECT_FIELD_CACHE_TTL = 300 # seconds
+_FIELD_CACHE: dict[tuple[str, str], tuple[float, str, dict]] = {}
+
+def _get_project_field_id_and_options_cached(project_url: str, field_name: str):
+    key = (project_url, field_name.lower())
+    cached = _FIELD_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < PROJECT_FIELD_CACHE_TTL:
+        return cached[1], cached[2]
+    field_id, options = _get_project_field_id_and_options(project_url, field_name)
+    _FIELD_CACHE[key] = (time.monotonic(), field_id, options)
+    return field_id, options
+
+def clear_project_caches():
+    _get_project_node_id.cache_clear()
+    _FIELD_CACHE.clear()
+    _clear_response_caches()
+
 def _github_create_project_item(project_url: str, title: str = None, body: str = "", issue_id: str = None) -> str:
     project_node_id = _get_project_node_id(project_url)
     
@@ -586,18 +1241,28 @@ def _github_create_project_item(project_url: str, title: str = None, body: str =
         message = "Created new draft issue in project."
     
     data = _graphql_query(mutation, variables)
-    item_id = data.get('addProjectV2Item', {}).get('item', {}).get('id') or \
-              data.get('addProjectV2DraftIssue', {}).get('projectV2Item', {}).get('id')
+    item_id = ((data.get('addProjectV2Item') or {}).get('item') or {}).get('id') or \
+              ((data.get('addProjectV2DraftIssue') or {}).get('projectV2Item') or {}).get('id')
 
     if not item_id:
-        raise Exception("Failed to create/link project item. Check input and permissions.")
+        raise GithubAPIError("Failed to create/link project item. Check input and permissions.")
 
-    return json.dumps({"success": True, "message": message, "item_id": item_id})
+    return _json_dumps({"success": True, "message": message, "item_id": item_id})
 
-def _github_get_project_items(project_url: str, state: str = "OPEN") -> str:
-    project_node_id = _get_project_node_id(project_url)
-    
-    query = """
+# Content selections for project items. The lean pair keeps only what listing and state filtering need.
+_PROJECT_CONTENT_FRAGMENTS = {
+    True: """
+        fragment IssueContent on Issue { number title body state url labels(first: 20) { nodes { name } } assignees(first: 20) { nodes { login } } milestone { title } createdAt updatedAt closedAt }
+        fragment PullRequestContent on PullRequest { number title url state createdAt updatedAt closedAt mergedAt }
+    """,
+    False: """
+        fragment IssueContent on Issue { number title state url }
+        fragment PullRequestContent on PullRequest { number title state url }
+    """,
+}
+
+# Fragments go first: _graphql_query appends the rateLimit selection before the document's final brace.
+_PROJECT_ITEMS_QUERY = """%s
         query($projectId: ID!, $first: Int!, $after: String) {
             node(id: $projectId) {
                 ... on ProjectV2 {
@@ -617,8 +1282,8 @@ def _github_get_project_items(project_url: str, state: str = "OPEN") -> str:
                                 }
                             }
                             content {
-                                ... on Issue { number title body state url labels(first: 5) { nodes { name } } assignees(first: 5) { nodes { login } } milestone { title } createdAt updatedAt closedAt }
-                                ... on PullRequest { number title url state createdAt updatedAt closedAt mergedAt }
+                                ...IssueContent
+                                ...PullRequestContent
                             }
                         }
                     }
@@ -626,66 +1291,86 @@ def _github_get_project_items(project_url: str, state: str = "OPEN") -> str:
             }
         }
     """
+_PROJECT_ITEMS_QUERIES = {full: _minify(_PROJECT_ITEMS_QUERY % fragments) for full, fragments in _PROJECT_CONTENT_FRAGMENTS.items()}
+
+# Keys both content fragments select, pulled out of each node in one call
+_LEAN_CONTENT_GET = itemgetter('number', 'title', 'state', 'url')
+_FULL_CONTENT_GET = itemgetter('number', 'title', 'state', 'url', 'createdAt', 'updatedAt', 'closedAt')
+_LABEL_NAME = itemgetter('name')
+_ASSIGNEE_LOGIN = itemgetter('login')
+
+def _project_content_fields(content: dict, include_content: bool) -> dict:
+    """Flattens an Issue/PullRequest content node into `content_*` keys for a project item."""
+    if not include_content:
+        number, title, content_state, url = _LEAN_CONTENT_GET(content)
+        return {"content_number": number, "content_title": title, "content_state": content_state, "content_url": url}
+    number, title, content_state, url, created_at, updated_at, closed_at = _FULL_CONTENT_GET(content)
+    # Only the Issue fragment selects labels, assignees, milestone and body.
+    labels = content.get('labels')
+    assignees = content.get('assignees')
+    milestone = content.get('milestone')
+    return {
+        "content_number": number,
+        "content_title": title,
+        "content_state": content_state,
+        "content_url": url,
+        "content_labels": list(map(_LABEL_NAME, labels['nodes'])) if labels else [],
+        "content_assignees": list(map(_ASSIGNEE_LOGIN, assignees['nodes'])) if assignees else [],
+        "content_milestone": milestone['title'] if milestone else None,
+        "content_created_at": created_at,
+        "content_updated_at": updated_at,
+        "content_closed_at": closed_at,
+        "content_body": content.get('body'),
+        "content_merged_at": content.get('mergedAt')
+    }
+
+def _iter_project_items(project_url: str, state: str = "OPEN", include_content: bool = True):
+    """Yields project items page by page, filtered by content state (OPEN, CLOSED or ALL).
+
+    With `include_content=False` only the number, title, state and URL of linked issues and pull requests are fetched.
+    """
+    project_node_id = _get_project_node_id(project_url)
+    query = _PROJECT_ITEMS_QUERIES[bool(include_content)]
     
-    items = []
-    has_next_page = True
-    end_cursor = None
-    
-    while has_next_page:
-        variables = {"projectId": project_node_id, "first": 50, "after": end_cursor}
-        data = _graphql_query(query, variables)
-        project_data = data['node']['items']
+    variables = {"projectId": project_node_id, "first": 100}
+    for item_node in _graphql_iter_nodes(query, variables, ("node", "items")):
+        # Filter before building anything: skipped items cost only these lookups.
+        if state != "ALL":
+            if item_node['type'] == "DRAFT_ISSUE":
+                if state != "OPEN":
+                    continue # Drafts have no state of their own and count as open
+            elif not item_node['content'] or item_node['content'].get('state') != state:
+                continue
         
-        for item_node in project_data['nodes']:
-            item_info = {
-                "id": item_node['id'],
-                "type": item_node['type'],
-                "fields": {}
-            }
-            
-            if item_node.get('fieldValues') and item_node['fieldValues'].get('nodes'):
-                for fv in item_node['fieldValues']['nodes']:
-                    field_name = fv['field']['name']
-                    if 'text' in fv: item_info['fields'][field_name] = fv['text']
-                    elif 'date' in fv: item_info['fields'][field_name] = fv['date']
-                    elif 'name' in fv: item_info['fields'][field_name] = fv['name']
-            
-            if item_node['content']:
-                content = item_node['content']
-                item_info.update({
-                    "content_number": content.get('number'),
-                    "content_title": content.get('title'),
-                    "content_state": content.get('state'),
-                    "content_url": content.get('url'),
-                    "content_body": content.get('body'),
-                    "content_labels": [l['name'] for l in content.get('labels', {}).get('nodes', [])] if content.get('labels') else [],
-                    "content_assignees": [a['login'] for a in content.get('assignees', {}).get('nodes', [])] if content.get('assignees') else [],
-                    "content_milestone": content.get('milestone', {}).get('title') if content.get('milestone') else None,
-                    "content_created_at": content.get('createdAt'),
-                    "content_updated_at": content.get('updatedAt'),
-                    "content_closed_at": content.get('closedAt'),
-                    "content_merged_at": content.get('mergedAt')
-                })
-            
-            should_add = False
-            if state == "ALL":
-                should_add = True
-            elif item_node['type'] == "DRAFT_ISSUE" and state == "OPEN":
-                should_add = True
-            elif item_node['content'] and item_node['content'].get('state') == state:
-                should_add = True
-            
-            if should_add:
-                items.append(item_info)
-
-        has_next_page = project_data['pageInfo']['hasNextPage']
-        end_cursor = project_data['pageInfo']['endCursor']
+        item_info = {
+            "id": item_node['id'],
+            "type": item_node['type'],
+            "fields": {}
+        }
+        
+        if item_node.get('fieldValues') and item_node['fieldValues'].get('nodes'):
+            for fv in item_node['fieldValues']['nodes']:
+                if not fv:
+                    continue # Value types the query doesn't select (number, iteration, ...) come back as {}
+                field_name = fv['field']['name']
+                if 'text' in fv: item_info['fields'][field_name] = fv['text']
+                elif 'date' in fv: item_info['fields'][field_name] = fv['date']
+                elif 'name' in fv: item_info['fields'][field_name] = fv['name']
         
-    return json.dumps(items, indent=2)
+        if item_node['content']:
+            item_info.update(_project_content_fields(item_node['content'], include_content))
+        
+        yield item_info
+
+def _github_get_project_items(project_url: str, state: str = "OPEN", include_content: bool = True) -> str:
+    # One compact item per line: indent=2 roughly doubled the payload with whitespace.
+    return "".join(_iter_json_array(_iter_project_items(project_url, state, include_content)))
 
 def _github_update_project_item_field(project_url: str, item_id: str, field_name: str, new_value: str = None, new_value_id: str = None) -> str:
+    # Both lookups only need the URL; if the project lookup fails the field result is simply discarded.
+    field_future = _GITHUB_EXECUTOR.submit(_get_project_field_id_and_options_cached, project_url, field_name)
     project_node_id = _get_project_node_id(project_url)
-    field_id, options = _get_project_field_id_and_options(project_node_id, field_name)
+    field_id, options = field_future.result()
     
     input_value = {}
     if new_value_id:
@@ -722,8 +1407,10 @@ def _github_update_project_item_field(project_url: str, item_id: str, field_name
         "value": input_value
     }
     
-    _graphql_query(mutation, variables)
-    return json.dumps({"success": True, "message": f"Field '{field_name}' updated for item '{item_id}' in project."})
+    data = _graphql_query(mutation, variables)
+    if not (data.get('updateProjectV2ItemFieldValue') or {}).get('projectV2Item'):
+        raise GithubAPIError("Failed to update project item field. Check input and permissions.")
+    return _json_dumps({"success": True, "message": f"Field '{field_name}' updated for item '{item_id}' in project."})
 
 def _github_delete_project_item(project_url: str, item_id: str) -> str:
     project_node_id = _get_project_node_id(project_url)
@@ -737,30 +1424,41 @@ def _github_delete_project_item(project_url: str, item_id: str) -> str:
     """
     variables = {"projectId": project_node_id, "itemId": item_id}
     data = _graphql_query(mutation, variables)
-    deleted_id = data.get('deleteProjectV2Item', {}).get('deletedItemId')
+    deleted_id = (data.get('deleteProjectV2Item') or {}).get('deletedItemId')
     if not deleted_id:
-        raise Exception("Failed to delete project item. Check input and permissions.")
-    return json.dumps({"success": True, "message": f"Project item '{item_id}' deleted from project."})
+        raise GithubAPIError("Failed to delete project item. Check input and permissions.")
+    return _json_dumps({"success": True, "message": f"Project item '{item_id}' deleted from project."})
+
+def _github_refresh_project_cache() -> str:
+    clear_project_caches()
+    return _json_dumps({"success": True, "message": "Cached project IDs, fields and options cleared."})
 
 # --- New uv and ruff Tool Implementations ---
 
+def _run(cmd: list, cwd: str = None) -> tuple[int, str, str]:
+    """Runs a command to completion and returns (returncode, stdout, stderr)."""
+    # communicate() drains both pipes in large reads; never pass bufsize=0 (unbuffered, one syscall per read).
+    process = subprocess.run(
+        cmd,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        bufsize=-1,
+        shell=False # Prefer shell=False for security and clarity
+    )
+    return process.returncode, process.stdout, process.stderr
+
 def _run_shell_command(command_parts: list, cwd: str = None) -> str:
     """Helper to run a shell command and capture its output."""
     try:
         # Ensure the command is run from the BASE_PATH or a safe sub-path
         actual_cwd = get_safe_path(cwd if cwd else ".")
         
-        process = subprocess.run(
-            command_parts,
-            cwd=actual_cwd,
-            capture_output=True,
-            text=True,
-            check=True, # Raise CalledProcessError for non-zero exit codes
-            shell=False # Prefer shell=False for security and clarity
-        )
-        return process.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        return f"ERROR: Command failed with exit code {e.returncode}.\nSTDOUT: {e.stdout.strip()}\nSTDERR: {e.stderr.strip()}"
+        returncode, stdout, stderr = _run(command_parts, cwd=actual_cwd)
+        if returncode != 0:
+            return f"ERROR: Command failed with exit code {returncode}.\nSTDOUT: {stdout.strip()}\nSTDERR: {stderr.strip()}"
+        return stdout.strip()
     except FileNotFoundError:
         return f"ERROR: Command '{command_parts[0]}' not found. Make sure it's installed and in your PATH."
     except Exception as e:
@@ -784,84 +1482,196 @@ def _ruff_check(path: str = ".", fix: bool = False) -> str:
 def _ruff_format(path: str = ".") -> str:
     return _run_shell_command(["ruff", "format", path])
 
+# The *_many variants hand every argument to a single uv/ruff process instead of spawning one per item.
+
+def _require_items(values: list, name: str) -> list:
+    if isinstance(values, str):
+        values = [values]
+    if not values:
+        raise ValueError(f"'{name}' must contain at least one entry.")
+    return list(values)
+
+def _uv_add_many(package_names: list) -> str:
+    return _run_shell_command(["uv", "add", *_require_items(package_names, "package_names")])
+
+def _ruff_check_many(paths: list, fix: bool = False) -> str:
+    command = ["ruff", "check", *_require_items(paths, "paths")]
+    if fix:
+        command.append("--fix")
+    return _run_shell_command(command)
+
+def _ruff_format_many(paths: list) -> str:
+    return _run_shell_command(["ruff", "format", *_require_items(paths, "paths")])
+
+# --- Streaming Tool Output ---
+# These tools produce their result incrementally, so the response can be written while it is produced.
+
+_END = object()
+
+def _iter_json_array(items):
+    """Yields a JSON array one element per line. The first element is fetched before anything is yielded."""
+    items = iter(items)
+    first = next(items, _END)
+    if first is _END:
+        yield "[]"
+        return
+    yield "[\n" + _json_dumps(first)
+    for item in items:
+        yield ",\n" + _json_dumps(item)
+    yield "\n]"
+
+def _iter_joined(parts, sep):
+    parts = iter(parts)
+    first = next(parts, _END)
+    if first is _END:
+        return
+    yield first
+    for part in parts:
+        yield sep + part
+
+def _streaming(func):
+    """Marks a TOOL_DISPATCH handler whose output is written to stdout as it is produced."""
+    func.streaming = True
+    return func
+
+@_streaming
+def _stream_list_directory(path: str, recursive: bool = False):
+    return _iter_joined(_iter_directory(path, recursive), "\n")
+
+@_streaming
+def _stream_github_get_project_items(project_url: str, state: str = "OPEN", include_content: bool = True):
+    return _iter_json_array(_iter_project_items(project_url, state, include_content))
+
+@_streaming
+def _stream_github_list_issues(repo_full_name: str, state: str = "open", labels: list | None = None, assignee: str = None, milestone_number: int = None, sort: str = "created", direction: str = "desc", since: str = None):
+    return _iter_json_array(_iter_issues(repo_full_name, state, labels, assignee, milestone_number, sort, direction, since))
+
 # --- MCP Server Logic ---
 
 def send_response(response_data):
     """Sends a JSON response back to the client."""
-    sys.stdout.write(json.dumps(response_data) + "\n")
-    sys.stdout.flush()
+    send_raw_response(_json_bytes(response_data))
 
-def handle_request(request):
-    """Handles an incoming MCP request."""
-    method = request.get("method")
-    params = request.get("params", {})
-    request_id = request.get("id")
+def send_raw_response(payload: bytes):
+    """Sends an already-serialized JSON response back to the client."""
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
 
-    if method == "mcp_ping":
-        send_response({"jsonrpc": "2.0", "result": "pong", "id": request_id})
-    elif method == "mcp_queryTools":
-        send_response({"jsonrpc": "2.0", "result": {"tools": TOOL_DEFINITIONS}, "id": request_id})
-    elif method == "mcp_callTool":
-        tool_name = params.get("toolName")
-        tool_args = params.get("toolArgs", {})
-        
-        result = None
-        error = None
-        
+def send_streamed_tool_result(request_id, first_chunk, chunks):
+    """Writes a toolResult response while `chunks` are still being produced.
+
+    The result string is escaped chunk by chunk between a fixed envelope prefix and suffix. Errors after
+    the first chunk can no longer become a JSON-RPC error, so they are appended to the result text instead.
+    """
+    out = sys.stdout.buffer
+    write = out.write
+    write(b'{"jsonrpc": "2.0", "result": {"toolResult": "')
+    write(_json_bytes(first_chunk)[1:-1])
+    try:
+        for chunk in chunks:
+            write(_json_bytes(chunk)[1:-1])
+    except Exception as e:
+        print(f"Server Error: streamed tool output failed: {type(e).__name__}: {str(e)}", file=sys.stderr)
+        write(_json_bytes(f"\n[Output truncated: {type(e).__name__}: {str(e)}]")[1:-1])
+    write(b'"}, "id": ' + _json_bytes(request_id) + b'}\n')
+    out.flush()
+
+def _github_create_project_item_checked(**tool_args):
+    if not tool_args.get("issue_id") and not tool_args.get("title"):
+        raise ValueError("Either 'title' or 'issue_id' must be provided for github_create_project_item.")
+    return _github_create_project_item(**tool_args)
+
+TOOL_DISPATCH = {
+    # File system tools
+    "read_file": _read_file,
+    "write_file": _write_file,
+    "append_to_file": _append_to_file,
+    "list_directory": _stream_list_directory,
+    "create_directory": _create_directory,
+    # GitHub tools
+    "github_create_issue": _github_create_issue,
+    "github_get_issue": _github_get_issue,
+    "github_get_issues": _github_get_issues,
+    "github_update_issue": _github_update_issue,
+    "github_list_issues": _stream_github_list_issues,
+    "github_create_project_item": _github_create_project_item_checked,
+    "github_get_project_items": _stream_github_get_project_items,
+    "github_update_project_item_field": _github_update_project_item_field,
+    "github_delete_project_item": _github_delete_project_item,
+    "github_refresh_project_cache": lambda **_: _github_refresh_project_cache(),
+    # uv and ruff tools
+    "uv_sync": lambda **_: _uv_sync(),
+    "uv_add": _uv_add,
+    "uv_add_many": _uv_add_many,
+    "uv_remove": _uv_remove,
+    "ruff_check": _ruff_check,
+    "ruff_check_many": _ruff_check_many,
+    "ruff_format": _ruff_format,
+    "ruff_format_many": _ruff_format_many,
+}
+
+def _handle_ping(request_id, params):
+    send_response({"jsonrpc": "2.0", "result": "pong", "id": request_id})
+
+def _handle_query_tools(request_id, params):
+    send_raw_response(b'{"jsonrpc": "2.0", "result": {"tools": ' + get_tool_definitions_bytes() + b'}, "id": ' + _json_bytes(request_id) + b'}')
+
+def _handle_call_tool(request_id, params):
+    tool_name = params.get("toolName")
+    tool_args = params.get("toolArgs", {})
+    
+    handler = TOOL_DISPATCH.get(tool_name)
+    if getattr(handler, "streaming", False):
         try:
-            # File system tools
-            if tool_name == "read_file":
-                result = _read_file(**tool_args)
-            elif tool_name == "write_file":
-                result = _write_file(**tool_args)
-            elif tool_name == "append_to_file":
-                result = _append_to_file(**tool_args)
-            elif tool_name == "list_directory":
-                result = _list_directory(**tool_args)
-            elif tool_name == "create_directory":
-                result = _create_directory(**tool_args)
-            # GitHub tools
-            elif tool_name == "github_create_issue":
-                result = _github_create_issue(**tool_args)
-            elif tool_name == "github_get_issue":
-                result = _github_get_issue(**tool_args)
-            elif tool_name == "github_update_issue":
-                result = _github_update_issue(**tool_args)
-            elif tool_name == "github_list_issues":
-                result = _github_list_issues(**tool_args)
-            elif tool_name == "github_create_project_item":
-                if not tool_args.get("issue_id") and not tool_args.get("title"):
-                    raise ValueError("Either 'title' or 'issue_id' must be provided for github_create_project_item.")
-                result = _github_create_project_item(**tool_args)
-            elif tool_name == "github_get_project_items":
-                result = _github_get_project_items(**tool_args)
-            elif tool_name == "github_update_project_item_field":
-                result = _github_update_project_item_field(**tool_args)
-            elif tool_name == "github_delete_project_item":
-                result = _github_delete_project_item(**tool_args)
-            # uv and ruff tools
-            elif tool_name == "uv_sync":
-                result = _uv_sync()
-            elif tool_name == "uv_add":
-                result = _uv_add(**tool_args)
-            elif tool_name == "uv_remove":
-                result = _uv_remove(**tool_args)
-            elif tool_name == "ruff_check":
-                result = _ruff_check(**tool_args)
-            elif tool_name == "ruff_format":
-                result = _ruff_format(**tool_args)
-            else:
-                error = {"code": -32601, "message": f"Tool not found: {tool_name}"}
+            chunks = handler(**tool_args)
+            first_chunk = next(chunks, "")
         except Exception as e:
             error = {"code": -32000, "message": f"Tool execution failed for {tool_name}: {type(e).__name__}: {str(e)}"}
-            print(f"Server Error: {error['message']}", file=sys.stderr) 
-            
-        if error:
+            print(f"Server Error: {error['message']}", file=sys.stderr)
             send_response({"jsonrpc": "2.0", "error": error, "id": request_id})
         else:
-            send_response({"jsonrpc": "2.0", "result": {"toolResult": result}, "id": request_id})
+            send_streamed_tool_result(request_id, first_chunk, chunks)
+        return
+
+    result = None
+    error = None
+    stats_before = dict(_CACHE_STATS)
+    
+    if handler is None:
+        error = {"code": -32601, "message": f"Tool not found: {tool_name}"}
     else:
+        try:
+            result = handler(**tool_args)
+        except Exception as e:
+            error = {"code": -32000, "message": f"Tool execution failed for {tool_name}: {type(e).__name__}: {str(e)}"}
+            print(f"Server Error: {error['message']}", file=sys.stderr) 
+        
+    if error:
+        send_response({"jsonrpc": "2.0", "error": error, "id": request_id})
+    else:
+        response_result = {"toolResult": result}
+        cache_hits = {k: v - stats_before[k] for k, v in _CACHE_STATS.items() if v != stats_before[k]}
+        if cache_hits:
+            response_result["cacheHits"] = cache_hits
+        send_response({"jsonrpc": "2.0", "result": response_result, "id": request_id})
+
+METHOD_DISPATCH = {
+    "mcp_ping": _handle_ping,
+    "mcp_queryTools": _handle_query_tools,
+    "mcp_callTool": _handle_call_tool,
+}
+
+def handle_request(request):
+    """Handles an incoming MCP request."""
+    method = request.get("method")
+    params = request.get("params", {})
+    request_id = request.get("id")
+
+    handler = METHOD_DISPATCH.get(method)
+    if handler is None:
         send_response({"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": request_id})
+    else:
+        handler(request_id, params)
 
 def main():
     print("DevOps MCP Server started. Waiting for requests...", file=sys.stderr)
@@ -869,13 +1679,15 @@ def main():
     if not GITHUB_TOKEN:
         print("GitHub tools are disabled due to missing GITHUB_TOKEN environment variable.", file=sys.stderr)
 
+    # Requests are read as raw bytes and parsed in one step; the JSON decoder handles the UTF-8.
+    readline = sys.stdin.buffer.readline
     while True:
         try:
-            line = sys.stdin.readline()
+            line = readline()
             if not line:
                 break # EOF, client closed connection
             
-            request = json.loads(line)
+            request = _json_loads(line)
             handle_request(request)
         except json.JSONDecodeError:
             print("Invalid JSON received.", file=sys.stderr)
@@ -1,8 +1,10 @@
 import os
+import sys
 import subprocess
 import json
 import re
 from datetime import datetime, timedelta # For 'since' parameter in GitHub tools
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Configuration ---
 MEMORY_BANK_DIR = "memory-bank"
@@ -18,29 +20,128 @@ CORE_MEMORY_FILES = [
     "tasks.md",   # New
 ]
 
+# Starter content for core files missing from a new memory bank. {project_name} is filled in when written.
+_TEMPLATES = {
+    filename: f"# {filename.replace('.md', '').replace('Context', ' Context').replace('brief', ' Brief').replace('Patterns', ' Patterns').replace('progress', 'Progress').title()}\n\n"
+    for filename in CORE_MEMORY_FILES
+}
+_TEMPLATES.update({
+    "projectIntelligence.md": (
+        "# Project Intelligence for {project_name}\n\n"
+        "This file captures unique patterns, preferences, and challenges specific to this project.\n\n"
+        "## Learned Patterns:\n\n"
+        "## User Preferences:\n\n"
+        "## Known Issues/Challenges:\n\n"
+        "## Tool Usage Patterns:\n\n"
+    ),
+    "roadmap.md": "# Project Roadmap\n\n## High-Level Milestones:\n\n- [ ] Milestone 1: Initial Setup\n- [ ] Milestone 2: Core Feature Development\n\n",
+    "tasks.md": "# Project Tasks\n\n## Current Sprint Tasks:\n\n- [ ] Task 1: Implement basic user auth\n\n",
+})
+
+# Written once the memory bank has been bootstrapped, so later runs skip the per-file checks
+INITIALIZED_MARKER = os.path.join(MEMORY_BANK_DIR, ".initialized")
+
+# Fixed pieces of each memory bank block, so a rebuild only has to join them around the file contents
+_MB_HEADERS = {filename: f"## Memory Bank File: {filename}\n```markdown\n" for filename in CORE_MEMORY_FILES}
+_MB_FOOTER = "\n```\n"
+_MB_SEPARATOR = "\n---\n"
+_MB_MISSING = "(File not found - please create)"
+
+# Protocol text sent with every turn, between the mode line and the memory bank
+_PROMPT_INSTRUCTIONS = (
+    "You are an expert software engineer assistant following a strict protocol as defined in the `GEMINI.md` file."
+    "You have access to file system, GitHub, uv, and ruff tools via an MCP server. Use these tools to perform operations as needed.\n"
+    "Your current project memory bank is provided below. Use this context to inform all your responses and actions.\n"
+    "Adhere strictly to the Plan Mode and Act Mode workflows.\n"
+    "When you need to interact with the file system or GitHub, call the appropriate tool.\n"
+    "When updating memory bank files, directly call `write_file` or `append_to_file`.\n"
+    "When managing Python dependencies, call `uv_sync`, `uv_add`, or `uv_remove`.\n"
+    "When checking or formatting Python code, call `ruff_check` or `ruff_format`.\n\n"
+)
+
+# Everything before the user request, rebuilt only when the mode or the memory bank changes
+_STATIC_PROMPT_PREFIX: str = ""
+_PROMPT_PREFIX_KEY: tuple | None = None
+
+# Tool-call syntax that Gemini sometimes echoes into its final answer
+_TOOLCALL_JSON_RE = re.compile(r"```json\s*\{.*?\"toolName\":\s*\".*?\".*?\}\s*```", re.DOTALL)
+_TOOLCALL_CALL_RE = re.compile(r"call:\w+\(.*?\)")
+
 # State management for Plan/Act mode
 current_mode = "PLAN" # Start in Plan mode
 
+# Combined memory bank text, reused until a file's mtime or size changes
+_MB_CACHE: tuple | None = None
+_MB_VALUE: str = ""
+
 # --- Helper Functions ---
 
 def read_file_content(filepath):
     """Reads content of a single file."""
-    if os.path.exists(filepath):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-    return None
-
-def get_all_memory_bank_content():
-    """Reads all core memory bank files and returns their combined content."""
-    full_context_blocks = []
+    try:
+        # Unbuffered binary read: readall() sizes one read from fstat, then the bytes are decoded in a single call.
+        with open(filepath, 'rb', buffering=0) as f:
+            text = f.read().decode('utf-8')
+    except FileNotFoundError:
+        return None
+    if "\r" in text: # Match text-mode universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def _memory_bank_signature():
+    """Returns (filename, mtime_ns, size) for each core file, or None for a file that doesn't exist."""
+    signature = []
     for filename in CORE_MEMORY_FILES:
-        filepath = os.path.join(MEMORY_BANK_DIR, filename)
-        content = read_file_content(filepath)
-        if content is not None:
-            full_context_blocks.append(f"## Memory Bank File: {filename}\n```markdown\n{content.strip()}\n```\n")
+        try:
+            st = os.stat(os.path.join(MEMORY_BANK_DIR, filename))
+        except FileNotFoundError:
+            signature.append((filename, None))
         else:
-            full_context_blocks.append(f"## Memory Bank File: {filename}\n```markdown\n(File not found - please create)\n```\n")
-    return "\n---\n".join(full_context_blocks)
+            signature.append((filename, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+def get_all_memory_bank_content():
+    """Reads all core memory bank files and returns their combined content.
+
+    The result is cached and only rebuilt when a file's mtime or size changes.
+    """
+    global _MB_CACHE, _MB_VALUE
+    try:
+        signature = _memory_bank_signature()
+    except OSError:
+        signature = None # Can't tell whether anything changed, so always rebuild
+    if signature is not None and signature == _MB_CACHE:
+        return _MB_VALUE
+
+    # Only reached on a cache miss; the files are read in parallel so the wait is the slowest read, not the sum.
+    with ThreadPoolExecutor(max_workers=len(CORE_MEMORY_FILES)) as executor:
+        contents = list(executor.map(read_file_content, [os.path.join(MEMORY_BANK_DIR, f) for f in CORE_MEMORY_FILES]))
+
+    parts = []
+    for filename, content in zip(CORE_MEMORY_FILES, contents):
+        if parts:
+            parts.append(_MB_SEPARATOR)
+        parts += (_MB_HEADERS[filename], content.strip() if content is not None else _MB_MISSING, _MB_FOOTER)
+    _MB_VALUE = "".join(parts)
+    _MB_CACHE = signature
+    return _MB_VALUE
+
+def get_prompt_prefix(mode):
+    """Returns the mode line, protocol instructions and memory bank block that open every prompt."""
+    global _STATIC_PROMPT_PREFIX, _PROMPT_PREFIX_KEY
+    memory_bank_context = get_all_memory_bank_content()
+    key = (mode, _MB_CACHE)
+    if _MB_CACHE is not None and key == _PROMPT_PREFIX_KEY:
+        return _STATIC_PROMPT_PREFIX
+    _STATIC_PROMPT_PREFIX = "".join((
+        f"CURRENT_MODE: {mode}\n\n",
+        _PROMPT_INSTRUCTIONS,
+        "--- MEMORY BANK START ---\n",
+        memory_bank_context,
+        "\n--- MEMORY BANK END ---\n\n",
+    ))
+    _PROMPT_PREFIX_KEY = key
+    return _STATIC_PROMPT_PREFIX
 
 def call_gemini(prompt_text):
     """Calls the Gemini CLI with the given prompt and returns the output."""
@@ -73,8 +174,8 @@ def process_gemini_response_with_tools(gemini_output):
     # or Gemini explicitly showing its internal thought process.
     
     # Simple cleanup for any stray tool call patterns if Gemini echoes them
-    clean_output = re.sub(r"```json\s*\{.*?\"toolName\":\s*\".*?\".*?\}\s*```", "", gemini_output, flags=re.DOTALL)
-    clean_output = re.sub(r"call:\w+\(.*?\)", "", clean_output) # Remove simple 'call:tool()' patterns
+    clean_output = _TOOLCALL_JSON_RE.sub("", gemini_output)
+    clean_output = _TOOLCALL_CALL_RE.sub("", clean_output) # Remove simple 'call:tool()' patterns
 
     print(clean_output.strip())
 
@@ -84,26 +185,16 @@ def process_gemini_response_with_tools(gemini_output):
 def main():
     global current_mode 
 
-    # Ensure memory-bank directory exists and initial files are present
-    os.makedirs(MEMORY_BANK_DIR, exist_ok=True)
-    for filename in CORE_MEMORY_FILES:
-        filepath = os.path.join(MEMORY_BANK_DIR, filename)
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Provide a basic template for new files
-                if filename == "projectIntelligence.md":
-                    f.write(f"# Project Intelligence for {os.path.basename(os.getcwd())}\n\n"
-                            f"This file captures unique patterns, preferences, and challenges specific to this project.\n\n"
-                            f"## Learned Patterns:\n\n"
-                            f"## User Preferences:\n\n"
-                            f"## Known Issues/Challenges:\n\n"
-                            f"## Tool Usage Patterns:\n\n")
-                elif filename == "roadmap.md":
-                    f.write(f"# Project Roadmap\n\n## High-Level Milestones:\n\n- [ ] Milestone 1: Initial Setup\n- [ ] Milestone 2: Core Feature Development\n\n")
-                elif filename == "tasks.md":
-                    f.write(f"# Project Tasks\n\n## Current Sprint Tasks:\n\n- [ ] Task 1: Implement basic user auth\n\n")
-                else:
-                    f.write(f"# {filename.replace('.md', '').replace('Context', ' Context').replace('brief', ' Brief').replace('Patterns', ' Patterns').replace('progress', 'Progress').title()}\n\n")
+    # Ensure memory-bank directory exists and initial files are present (skipped once bootstrapped)
+    if not os.path.exists(INITIALIZED_MARKER):
+        os.makedirs(MEMORY_BANK_DIR, exist_ok=True)
+        project_name = os.path.basename(os.getcwd())
+        for filename in CORE_MEMORY_FILES:
+            filepath = os.path.join(MEMORY_BANK_DIR, filename)
+            if not os.path.exists(filepath):
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(_TEMPLATES[filename].replace("{project_name}", project_name))
+        open(INITIALIZED_MARKER, 'w').close()
     
     print(f"\n--- Gemini Orchestrator (Current Mode: {current_mode}) ---")
     print("Type 'plan' to switch to Plan Mode.")
@@ -129,28 +220,13 @@ def main():
             print("Switched to Act Mode. Gemini may now propose and execute file system and GitHub operations.")
             continue
 
-        gemini_mode_instruction = f"CURRENT_MODE: {current_mode}\n\n"
-
-        # Read all memory bank files
-        memory_bank_context = get_all_memory_bank_content()
-
-        full_gemini_prompt = (
-            f"{gemini_mode_instruction}"
-            f"You are an expert software engineer assistant following a strict protocol as defined in the `GEMINI.md` file."
-            f"You have access to file system, GitHub, uv, and ruff tools via an MCP server. Use these tools to perform operations as needed.\n"
-            f"Your current project memory bank is provided below. Use this context to inform all your responses and actions.\n"
-            f"Adhere strictly to the Plan Mode and Act Mode workflows.\n"
-            f"When you need to interact with the file system or GitHub, call the appropriate tool.\n"
-            f"When updating memory bank files, directly call `write_file` or `append_to_file`.\n"
-            f"When managing Python dependencies, call `uv_sync`, `uv_add`, or `uv_remove`.\n"
-            f"When checking or formatting Python code, call `ruff_check` or `ruff_format`.\n\n"
-            f"--- MEMORY BANK START ---\n"
-            f"{memory_bank_context}\n"
-            f"--- MEMORY BANK END ---\n\n"
-            f"--- USER REQUEST ---\n"
-            f"{user_query}\n"
-            f"--- END USER REQUEST ---\n"
-        )
+        # Mode line, instructions and memory bank are reused until the mode or a memory bank file changes
+        full_gemini_prompt = "".join((
+            get_prompt_prefix(current_mode),
+            "--- USER REQUEST ---\n",
+            user_query,
+            "\n--- END USER REQUEST ---\n",
+        ))
 
         gemini_output = call_gemini(full_gemini_prompt)
         